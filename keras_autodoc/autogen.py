@@ -1,15 +1,35 @@
+import os
+import sys
 import shutil
-import pathlib
-from inspect import getdoc, isclass
-from typing import Dict, Union, List, get_type_hints
+import itertools
+import linecache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import StringIO
+from inspect import getdoc, getsourcefile, isclass
+from typing import Dict, Optional, Union, List, get_type_hints
 
 from .docstring import process_docstring
 from .examples import copy_examples
 from .get_signatures import get_signature
+from .get_signatures import get_signature_parts
+from .get_signatures import format_signatures
 
 from . import utils
 
 
+def _link_or_copy(src, dst):
+    """Hard-link a template file, copying only when linking is impossible.
+
+    Hard links avoid byte-copying templates that are never modified;
+    `utils.insert_in_file` unlinks before writing so the source template
+    is never mutated through the link.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 class DocumentationGenerator:
     """Generates the documentation.
 
@@ -51,7 +71,7 @@ class DocumentationGenerator:
 
     def __init__(
         self,
-        pages: Dict[str, list] = {},
+        pages: Optional[Dict[str, list]] = None,
         project_url: Union[str, Dict[str, str]] = None,
         template_dir=None,
         examples_dir=None,
@@ -59,11 +79,18 @@ class DocumentationGenerator:
         max_signature_line_length: int = 110,
         titles_size="###",
     ):
-        self.pages = pages
+        self.pages = {} if pages is None else pages
         self.project_url = project_url
         self.template_dir = template_dir
         self.examples_dir = examples_dir
         self.class_aliases = {}
+        self._object_cache = {}
+        self._type_hint_cache = {}
+        self._signature_cache = {}
+        self._render_cache = {}
+        # type-keyed dispatch: one dict hit instead of an isinstance
+        # cascade on the hot rendering path.
+        self._resolvers = {str: self._resolve_string}
         self._fill_aliases(extra_aliases)
         self.max_signature_line_length = max_signature_line_length
         self.titles_size = titles_size
@@ -78,30 +105,37 @@ class DocumentationGenerator:
         # Raises
             TypeError: if elements are not specified as list or dict of lists.
         """
-        dest_dir = pathlib.Path(dest_dir)
+        dest_dir = os.fspath(dest_dir)
         print("Cleaning up existing sources directory.")
-        if dest_dir.exists():
+        if os.path.isdir(dest_dir):
             shutil.rmtree(dest_dir)
 
         print("Populating sources directory with templates.")
         if self.template_dir:
-            shutil.copytree(self.template_dir, dest_dir)
+            shutil.copytree(self.template_dir, dest_dir, copy_function=_link_or_copy)
 
+        # pages are independent outputs, render them concurrently. Threads are
+        # enough since Black releases the GIL while formatting and most of the
+        # remaining time is import I/O. Tags living in the same file are kept
+        # together so a single file is never written to from two threads.
+        work_items = []
         for file_path, elements in self.pages.items():
             if isinstance(elements, list):
-                self._render_list_and_insert(elements, dest_dir / file_path)
+                work_items.append(
+                    (os.path.join(dest_dir, file_path), [(elements, "autogenerated")])
+                )
             elif isinstance(elements, dict):
+                tagged_lists = []
                 for tag, grouped_elements in elements.items():
                     if isinstance(grouped_elements, list):
-                        self._render_list_and_insert(
-                            grouped_elements, dest_dir / file_path, tag
-                        )
+                        tagged_lists.append((grouped_elements, tag))
                     else:
                         raise TypeError(
                             "Expected list of elements to be documented, is of type {}: {}".format(
                                 type(grouped_elements), grouped_elements
                             )
                         )
+                work_items.append((os.path.join(dest_dir, file_path), tagged_lists))
             else:
                 raise TypeError(
                     "Expected list of elements to be documented, is of type {}: {}".format(
@@ -109,8 +143,18 @@ class DocumentationGenerator:
                     )
                 )
 
+        self._warm_linecache()
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self._render_page, file_path, tagged_lists)
+                for file_path, tagged_lists in work_items
+            ]
+            for future in as_completed(futures):
+                future.result()
+
         if self.examples_dir is not None:
-            copy_examples(self.examples_dir, dest_dir / "examples")
+            copy_examples(self.examples_dir, os.path.join(dest_dir, "examples"))
 
     def process_docstring(self, docstring, types: dict = None):
         """Can be overridden."""
@@ -121,70 +165,185 @@ class DocumentationGenerator:
         """Can be overridden."""
         return signature
 
-    def _render(self, element):
-        if isinstance(element, str):
-            object_ = utils.import_object(element)
-            if utils.ismethod(object_) or isinstance(object_, property):
-                # we remove the modules when displaying the methods
-                signature_override = ".".join(element.split(".")[-2:])
+    def _import_object(self, element_as_str):
+        """Import an object, reusing the lookups done in `_fill_aliases`."""
+        try:
+            return self._object_cache[element_as_str]
+        except KeyError:
+            object_ = utils.import_object(element_as_str)
+            self._object_cache[element_as_str] = object_
+            return object_
+
+    def _get_type_hints(self, object_):
+        """`get_type_hints` re-evaluates annotations on each call, cache it.
+
+        When no annotation is a string there is nothing to evaluate, so
+        `__annotations__` can be read directly, skipping the slow `eval`
+        path of `get_type_hints` entirely.
+        """
+        annotations = getattr(object_, "__annotations__", None)
+        if not annotations:
+            # un-annotated callables are the common case, skip the cache.
+            return {}
+        key = id(object_)
+        if key not in self._type_hint_cache:
+            if any(isinstance(value, str) for value in annotations.values()):
+                self._type_hint_cache[key] = get_type_hints(object_)
             else:
-                signature_override = element
+                self._type_hint_cache[key] = dict(annotations)
+        return self._type_hint_cache[key]
+
+    def _resolve_element(self, element):
+        resolver = self._resolvers.get(type(element), self._resolve_object)
+        return resolver(element)
+
+    def _resolve_string(self, element):
+        object_ = self._import_object(element)
+        if utils.ismethod(object_) or isinstance(object_, property):
+            # we remove the modules when displaying the methods.
+            # rpartition keeps the last two components without
+            # allocating a list of all of them.
+            head, _, last = element.rpartition(".")
+            _, _, mid = head.rpartition(".")
+            signature_override = f"{mid}.{last}" if mid else last
         else:
-            signature_override = None
-            object_ = element
+            signature_override = element
+        return object_, signature_override
+
+    @staticmethod
+    def _resolve_object(element):
+        return element, None
 
-        return self._render_from_object(object_, signature_override)
+    def _render(self, element):
+        out = StringIO()
+        self._render_into(element, out)
+        return out.getvalue()
+
+    def _render_into(self, element, out):
+        # elements cross-referenced from several pages render identically,
+        # so reuse the markdown produced the first time.
+        key = (
+            element if isinstance(element, str) else id(element),
+            self.titles_size,
+        )
+        rendered = self._render_cache.get(key)
+        if rendered is None:
+            object_, signature_override = self._resolve_element(element)
+            buffer = StringIO()
+            self._render_from_object(object_, signature_override, buffer)
+            rendered = self._render_cache[key] = buffer.getvalue()
+        out.write(rendered)
+
+    def _prime_signature_cache(self, element_list):
+        """Format all signatures of a page in one Black call.
+
+        Black's per-call setup is significant, so batching the whole page
+        is much cheaper than formatting signature by signature.
+        """
+        pending = {}
+        for element in element_list:
+            object_, signature_override = self._resolve_element(element)
+            if isinstance(object_, property):
+                continue
+            key = (
+                id(object_), signature_override, self.max_signature_line_length
+            )
+            if key not in self._signature_cache and key not in pending:
+                pending[key] = get_signature_parts(object_, signature_override)
+        if not pending:
+            return
+        formatted = format_signatures(
+            list(pending.values()), self.max_signature_line_length
+        )
+        for key, signature in zip(pending, formatted):
+            self._signature_cache[key] = signature
+
+    def _warm_linecache(self):
+        """Read each documented module's source once before rendering.
+
+        getdoc and the source-link lookups pull lines through linecache;
+        warming it up front turns many interleaved lazy reads into one
+        sequential read per module.
+        """
+        modules = set()
+        for object_ in self._object_cache.values():
+            module = getattr(object_, "__module__", None)
+            if module is not None:
+                modules.add(module)
+        linecache.checkcache()
+        for module in modules:
+            module_obj = sys.modules.get(module)
+            if module_obj is None:
+                continue
+            try:
+                filename = getsourcefile(module_obj)
+            except TypeError:
+                continue
+            if filename:
+                linecache.getlines(filename)
+
+    def _render_page(self, file_path, tagged_lists):
+        for element_list, tag in tagged_lists:
+            self._render_list_and_insert(element_list, file_path, tag)
 
     def _render_list_and_insert(self, element_list, file_path, tag="autogenerated"):
-        markdown_text = ""
+        self._prime_signature_cache(element_list)
+        out = StringIO()
         for element in element_list:
-            markdown_text += self._render(element)
-        utils.insert_in_file(markdown_text, file_path, tag)
+            self._render_into(element, out)
+        utils.insert_in_file(out.getvalue(), file_path, tag)
+
+    def _render_from_object(self, object_, signature_override: str, out):
+        # decide once whether we document the property getter or the object
+        # itself instead of re-checking in every branch below.
+        is_property = isinstance(object_, property)
+        target = object_.fget if is_property else object_
 
-    def _render_from_object(self, object_, signature_override: str):
-        subblocks = []
         if self.project_url is not None:
-            if isinstance(object_, property):
-                subblocks.append(utils.make_source_link(object_.fget, self.project_url))
-            else:
-                subblocks.append(utils.make_source_link(object_, self.project_url))
-        signature = get_signature(
-            object_, signature_override, self.max_signature_line_length
+            out.write(utils.make_source_link(target, self.project_url))
+            out.write("\n\n")
+        # Black formatting dominates the profile, so reuse signatures already
+        # formatted for the same object.
+        signature_key = (
+            id(object_), signature_override, self.max_signature_line_length
         )
+        signature = self._signature_cache.get(signature_key)
+        if signature is None:
+            signature = get_signature(
+                object_, signature_override, self.max_signature_line_length
+            )
+            self._signature_cache[signature_key] = signature
         signature = self.process_signature(signature)
 
-        if not isinstance(object_, property):
-            subblocks.append(f"{self.titles_size} {object_.__name__}\n")
-            subblocks.append(utils.code_snippet(signature))
-        else:
-            object_ = object_.fget
-            subblocks.append(f"{self.titles_size} {object_.__name__}\n")
+        out.write(f"{self.titles_size} {target.__name__}\n")
+        if not is_property:
+            out.write("\n\n")
+            out.write(utils.code_snippet(signature))
 
-        docstring = getdoc(object_)
+        docstring = getdoc(target)
         if docstring:
-            if isclass(object_):
-                type_hints = get_type_hints(object_.__init__)
+            if isclass(target):
+                type_hints = self._get_type_hints(target.__init__)
             else:
-                type_hints = get_type_hints(object_)
-            docstring = self.process_docstring(docstring, type_hints)
-            subblocks.append(docstring)
-        return "\n\n".join(subblocks) + "\n\n----\n\n"
+                type_hints = self._get_type_hints(target)
+            out.write("\n\n")
+            out.write(self.process_docstring(docstring, type_hints))
+        out.write("\n\n----\n\n")
 
     def _fill_aliases(self, extra_aliases):
+        # deduplicate first so symbols shared between pages are imported once.
+        # A dict keeps the insertion order a set would lose.
+        unique_elements = {}
         for elements in self.pages.values():
             if isinstance(elements, dict):
-                # collect all lists of elements to be documented
-                list_elements = []
-                for element in elements.values():
-                    list_elements += element
-            else:
-                list_elements = elements
-            for element_as_str in list_elements:
-                element = utils.import_object(element_as_str)
-                if not isclass(element):
-                    continue
-                true_dotted_path = utils.get_dotted_path(element)
-                self.class_aliases[true_dotted_path] = element_as_str
+                elements = itertools.chain.from_iterable(elements.values())
+            unique_elements.update(dict.fromkeys(elements))
+        for element_as_str in unique_elements:
+            element = self._import_object(element_as_str)
+            if not isclass(element):
+                continue
+            true_dotted_path = utils.get_dotted_path(element)
+            self.class_aliases[true_dotted_path] = element_as_str
 
         if isinstance(extra_aliases, dict):
             self.class_aliases.update(extra_aliases)
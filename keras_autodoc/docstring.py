@@ -4,6 +4,11 @@ from sphinx.util.typing import stringify_annotation
 
 from . import utils
 
+_indented_sections_start_re = re.compile(r"\n# .+?\n")
+_indented_sections_end_re = re.compile(r"\S\n+(\S|$)")
+_list_item_re = re.compile(r"\n([^ ].*?):")
+_first_list_item_re = re.compile(r"^([^ ].*?):")
+
 
 def get_code_blocks(docstring):
     code_blocks = {}
@@ -22,8 +27,7 @@ def get_code_blocks(docstring):
 
 
 def get_section_end(docstring, section_start):
-    regex_indented_sections_end = re.compile(r"\S\n+(\S|$)")
-    end = re.search(regex_indented_sections_end, docstring[section_start:])
+    end = _indented_sections_end_re.search(docstring[section_start:])
     section_end = section_start + end.end()
     if section_end == len(docstring):
         return section_end
@@ -32,11 +36,9 @@ def get_section_end(docstring, section_start):
 
 
 def get_google_style_sections_without_code(docstring):
-    regex_indented_sections_start = re.compile(r"\n# .+?\n")
-
     google_style_sections = {}
     for i in itertools.count():
-        match = re.search(regex_indented_sections_start, docstring)
+        match = _indented_sections_start_re.search(docstring)
         if match is None:
             break
         section_start = match.start() + 1
@@ -80,8 +82,8 @@ def to_markdown(google_style_section: str, types: dict = None, aliases=None) ->
 
 
 def format_as_markdown_list(section_body, types: dict = None, aliases: dict = None):
-    section_body = re.sub(r"\n([^ ].*?):", r"\n- __\1__:", section_body)
-    section_body = re.sub(r"^([^ ].*?):", r"- __\1__:", section_body)
+    section_body = _list_item_re.sub(r"\n- __\1__:", section_body)
+    section_body = _first_list_item_re.sub(r"- __\1__:", section_body)
 
     # Optionally add type annotations to docstring
     if types:
@@ -109,6 +111,10 @@ def reinject_strings(target, strings_to_inject):
 def process_docstring(docstring, types: dict = None, aliases=None):
     if docstring[-1] != "\n":
         docstring += "\n"
+    # plain docstrings without sections or code blocks need no rewriting,
+    # skip the whole extract/convert/reinject machinery for them.
+    if "\n# " not in docstring and "```" not in docstring:
+        return docstring
     google_style_sections, docstring = get_google_style_sections(docstring)
 
     for token, google_style_section in google_style_sections.items():
@@ -63,6 +63,46 @@ def get_signature(object_, override=None, max_line_length: int = 110):
         return get_function_signature(object_, override, max_line_length)
 
 
+def get_signature_parts(object_, override=None):
+    """Return the raw `(signature_start, signature_end)` pair for an object.
+
+    Properties are not supported since their signature is not formatted
+    with Black.
+    """
+    if inspect.isclass(object_):
+        if override is None:
+            override = f'{object_.__module__}.{object_.__name__}'
+        return override, get_signature_end(object_.__init__)
+    if override is None:
+        override = get_signature_start(object_)
+    return override, get_signature_end(object_)
+
+
+_BATCH_SEPARATOR = '# ---AUTODOC-SEP---'
+
+
+def format_signatures(signature_parts, max_line_length: int = 110):
+    """Format several signatures with a single Black invocation.
+
+    `signature_parts` is a list of `(signature_start, signature_end)` pairs
+    as produced by `get_signature_parts`. Joining the fake declarations and
+    formatting them in one `black.format_str` call amortizes Black's
+    per-call setup over the whole batch.
+    """
+    fake_defs = []
+    for signature_start, signature_end in signature_parts:
+        fake_signature_start = 'x' * len(signature_start)
+        fake_defs.append(f'def {fake_signature_start}{signature_end}:\n    pass\n')
+    joined = f'\n{_BATCH_SEPARATOR}\n'.join(fake_defs)
+    mode = black.FileMode(line_length=max_line_length)
+    formatted = black.format_str(joined, mode=mode)
+    return [
+        signature_start + extract_signature_end(formatted_def)
+        for (signature_start, _), formatted_def
+        in zip(signature_parts, formatted.split(_BATCH_SEPARATOR))
+    ]
+
+
 def format_signature(
     signature_start: str, signature_end: str, max_line_length: int = 110
 ):
@@ -1,5 +1,7 @@
 import re
 import os
+import ast
+import sys
 import inspect
 import importlib
 
@@ -23,9 +25,11 @@ def insert_in_file(markdown_text, file_path, tag):
         file_path: path to file to insert text in.
         tag: a tag name without parenthesis to replace with content.
     """
+    file_path = os.fspath(file_path)
     tag_par = "{{" + tag + "}}"
-    if file_path.exists():
-        template = file_path.read_text(encoding="utf-8")
+    if os.path.exists(file_path):
+        with open(file_path, encoding="utf-8") as f:
+            template = f.read()
         if tag_par not in template:
             raise RuntimeError(f"Template found for {file_path} but missing "
                                f"{tag_par} tag.")
@@ -35,20 +39,76 @@ def insert_in_file(markdown_text, file_path, tag):
             file_path)
     else:
         print("...creating new page with autogenerated content:", file_path)
-    os.makedirs(file_path.parent, exist_ok=True)
-    file_path.write_text(markdown_text, encoding="utf-8")
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    # templates may be hard links to their source, so unlink first to
+    # avoid writing through the link into the template directory.
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
+    # encode once and write in a single syscall, skipping the buffering
+    # of the text-mode IO stack on multi-megabyte pages.
+    data = markdown_text.encode("utf-8")
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 def code_snippet(snippet):
     return f'```python\n{snippet}\n```\n'
 
 
+# per-module {qualname: lineno} tables so source links don't re-read and
+# re-tokenize the module source once per symbol.
+_module_index_cache = {}
+
+
+def _build_module_index(module_name):
+    try:
+        filename = inspect.getsourcefile(sys.modules[module_name])
+        with open(filename, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename)
+    except (KeyError, TypeError, OSError, SyntaxError):
+        return {}
+    index = {}
+    definitions = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, definitions):
+                # like inspect.getsourcelines, the source of a decorated
+                # object starts at its first decorator.
+                if child.decorator_list:
+                    index[prefix + child.name] = child.decorator_list[0].lineno
+                else:
+                    index[prefix + child.name] = child.lineno
+                visit(child, f'{prefix}{child.name}.')
+
+    visit(tree, '')
+    return index
+
+
+def get_source_line(object_):
+    """Line number at which the source of `object_` starts."""
+    module = getattr(object_, '__module__', None)
+    qualname = getattr(object_, '__qualname__', None)
+    if module is not None and qualname is not None:
+        if module not in _module_index_cache:
+            _module_index_cache[module] = _build_module_index(module)
+        line = _module_index_cache[module].get(qualname)
+        if line is not None:
+            return line
+    return inspect.getsourcelines(object_)[-1]
+
+
 def make_source_link(cls, project_url):
     if isinstance(project_url, dict):
         base_module = cls.__module__.split('.')[0]
         project_url = project_url[base_module]
     path = cls.__module__.replace(".", "/")
-    line = inspect.getsourcelines(cls)[-1]
+    line = get_source_line(cls)
     return (f'<span style="float:right;">'
             f'[[source]]({project_url}/{path}.py#L{line})'
             f'</span>')
@@ -131,5 +191,16 @@ def remove_indentation(string):
     return string
 
 
+# classes have process-stable identity, so their dotted path can be
+# cached by id instead of recomputed from attribute lookups every time.
+_dotted_path_cache = {}
+
+
 def get_dotted_path(class_):
-    return f'{class_.__module__}.{class_.__qualname__}'
+    key = id(class_)
+    path = _dotted_path_cache.get(key)
+    if path is None:
+        path = _dotted_path_cache[key] = (
+            f'{class_.__module__}.{class_.__qualname__}'
+        )
+    return path